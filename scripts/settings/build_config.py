@@ -0,0 +1,16 @@
+import logging
+
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import dump_prebuilt_config
+
+log = logging.getLogger(__name__)
+
+
+def main() -> None:
+    configure_logging()
+    prebuilt_path = dump_prebuilt_config()
+    log.info("Prebuilt config written to: '%s'", prebuilt_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import logging
+
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import dump_settings_snapshot
+
+log = logging.getLogger(__name__)
+
+
+def main() -> None:
+    configure_logging()
+    snapshot_path = dump_settings_snapshot()
+    log.info("Settings snapshot written to: '%s'", snapshot_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,23 +44,22 @@ class ReactivateUserInteractor:
         user_service: UserService,
         transaction_manager: TransactionManager,
     ):
-        self._current_user_service = current_user_service
-        self._authorization_service = authorization_service
+        self._get_current_user = current_user_service.get_current_user
+        self._authorize = authorization_service.authorize_for_subordinate_role
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
 
     async def __call__(self, request_data: ReactivateUserRequest) -> None:
-        log.info(
-            "Reactivate user: started. Username: '%s'.",
-            request_data.username,
-        )
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "Reactivate user: started. Username: '%s'.",
+                request_data.username,
+            )
 
-        current_user = await self._current_user_service.get_current_user()
-        self._authorization_service.authorize_for_subordinate_role(
-            current_user.role,
-            target_role=UserRole.USER,
-        )
+        current_user = await self._get_current_user()
+        role = current_user.role
+        self._authorize(role, target_role=UserRole.USER)
 
         username = Username(request_data.username)
         user: User | None = await self._user_command_gateway.read_by_username(
@@ -70,15 +69,11 @@ class ReactivateUserInteractor:
         if user is None:
             raise UserNotFoundByUsernameError(username)
 
-        self._authorization_service.authorize_for_subordinate_role(
-            current_user.role,
-            target_role=user.role,
-        )
+        self._authorize(role, target_role=user.role)
 
         self._user_service.toggle_user_activation(user, is_active=True)
         await self._transaction_manager.commit()
 
-        log.info(
-            "Reactivate user: done. Username: '%s'.",
-            user.username.value,
-        )
+        if log.isEnabledFor(logging.INFO):
+            username_str = user.username.value
+            log.info("Reactivate user: done. Username: '%s'.", username_str)
@@ -26,6 +26,12 @@ class DirContents(StrEnum):
     SECRETS_NAME = ".secrets.toml"
     EXPORT_NAME = "export.toml"
     DOTENV_NAME = ".env"
+    SETTINGS_SNAPSHOT_NAME = ".settings.snapshot.pkl"
+    PREBUILT_CONFIG_NAME = ".config.prebuilt.json"
+    LAST_GOOD_SECRETS_NAME = ".secrets.last_good.pkl"
+
+
+CONFIG_CACHE_SUFFIX: Final[str] = ".cache.pkl"
 
 
 BASE_DIR_PATH: Final[Path] = Path(__file__).resolve().parent.parent.parent.parent.parent
@@ -1,17 +1,28 @@
+import hashlib
+import inspect
 import logging
 import os
+import pickle  # noqa: S403
+import tempfile
+from collections.abc import Mapping
 from datetime import timedelta
-from typing import Any, Literal
+from functools import cache, cached_property
+from pathlib import Path
+from typing import Any, Literal, Self, cast
 
-import rtoml
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     PostgresDsn,
+    ValidationError,
     field_validator,
+    model_validator,
 )
+from pydantic_core import InitErrorDetails, PydanticCustomError
 
 from app.setup.config.constants import (
+    CONFIG_CACHE_SUFFIX,
     ENV_TO_DIR_PATHS,
     ENV_VAR_NAME,
     DirContents,
@@ -26,10 +37,14 @@ log = logging.getLogger(__name__)
 
 
 class PasswordSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     pepper: str = Field(alias="PEPPER")
 
 
 class AuthSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     jwt_secret: str = Field(alias="JWT_SECRET")
     jwt_algorithm: Literal[
         "HS256",
@@ -42,46 +57,92 @@ class AuthSettings(BaseModel):
     session_ttl_min: timedelta = Field(alias="SESSION_TTL_MIN")
     session_refresh_threshold: float = Field(alias="SESSION_REFRESH_THRESHOLD")
 
-    @field_validator("session_ttl_min", mode="before")
-    @classmethod
-    def convert_session_ttl_min(cls, v: Any) -> timedelta:
-        if not isinstance(v, (int, float)):
-            raise ValueError("SESSION_TTL_MIN must be a number (n of minutes, n >= 1).")
-        if v < 1:
-            raise ValueError("SESSION_TTL_MIN must be at least 1 (n of minutes).")
-        return timedelta(minutes=v)
-
-    @field_validator("session_refresh_threshold", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def validate_session_refresh_threshold(cls, v: Any) -> float:
-        if not isinstance(v, (int, float)):
-            raise ValueError(
-                "SESSION_REFRESH_THRESHOLD must be a number "
-                "(fraction, 0 < fraction < 1).",
-            )
-        if not 0 < v < 1:
-            raise ValueError(
-                "SESSION_REFRESH_THRESHOLD must be between 0 and 1, exclusive.",
-            )
-        return v
+    def convert_session_params(cls, data: Any) -> Any:
+        """
+        Checks both session parameters in a single pass over the raw input.
+        Errors are reported per field, carrying only the offending value,
+        so that the rest of the input (e.g. the JWT secret) is never echoed.
+        """
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        errors: list[InitErrorDetails] = []
+        if "SESSION_TTL_MIN" in data:
+            ttl_min = data["SESSION_TTL_MIN"]
+            if not isinstance(ttl_min, (int, float)):
+                errors.append(
+                    cls._field_error(
+                        "SESSION_TTL_MIN",
+                        ttl_min,
+                        "SESSION_TTL_MIN must be a number (n of minutes, n >= 1).",
+                    ),
+                )
+            elif ttl_min < 1:
+                errors.append(
+                    cls._field_error(
+                        "SESSION_TTL_MIN",
+                        ttl_min,
+                        "SESSION_TTL_MIN must be at least 1 (n of minutes).",
+                    ),
+                )
+            else:
+                data["SESSION_TTL_MIN"] = timedelta(minutes=ttl_min)
+        if "SESSION_REFRESH_THRESHOLD" in data:
+            threshold = data["SESSION_REFRESH_THRESHOLD"]
+            if not isinstance(threshold, (int, float)):
+                errors.append(
+                    cls._field_error(
+                        "SESSION_REFRESH_THRESHOLD",
+                        threshold,
+                        "SESSION_REFRESH_THRESHOLD must be a number "
+                        "(fraction, 0 < fraction < 1).",
+                    ),
+                )
+            elif not 0 < threshold < 1:
+                errors.append(
+                    cls._field_error(
+                        "SESSION_REFRESH_THRESHOLD",
+                        threshold,
+                        "SESSION_REFRESH_THRESHOLD must be between 0 and 1, exclusive.",
+                    ),
+                )
+        if errors:
+            raise ValidationError.from_exception_data(cls.__name__, errors)
+        return data
+
+    @staticmethod
+    def _field_error(field: str, value: Any, message: str) -> InitErrorDetails:
+        return InitErrorDetails(
+            type=PydanticCustomError("value_error", message),
+            loc=(field,),
+            input=value,
+        )
 
 
 class CookiesSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     secure: bool = Field(alias="SECURE")
 
 
 class SecuritySettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     password: PasswordSettings
     auth: AuthSettings
     cookies: CookiesSettings
 
 
 class PostgresSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     user: str = Field(alias="USER")
     password: str = Field(alias="PASSWORD")
     db: str = Field(alias="DB")
     host: str = Field(alias="HOST")
-    port: int = Field(alias="PORT")
+    port: int = Field(alias="PORT", ge=1, le=65535)
     driver: str = Field(alias="DRIVER")
 
     @field_validator("host")
@@ -92,14 +153,7 @@ class PostgresSettings(BaseModel):
             return postgres_host_env
         return v
 
-    @field_validator("port")
-    @classmethod
-    def validate_port_range(cls, v: int) -> int:
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-
-    @property
+    @cached_property
     def dsn(self) -> str:
         return str(
             PostgresDsn.build(
@@ -112,8 +166,21 @@ class PostgresSettings(BaseModel):
             ),
         )
 
+    def model_copy(
+        self,
+        *,
+        update: Mapping[str, Any] | None = None,
+        deep: bool = False,
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # `model_copy` carries over `__dict__`, including the cached `dsn`.
+        copied.__dict__.pop("dsn", None)
+        return copied
+
 
 class SqlaEngineSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     echo: bool = Field(alias="ECHO")
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
@@ -121,10 +188,14 @@ class SqlaEngineSettings(BaseModel):
 
 
 class LoggingSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     level: LoggingLevel = Field(alias="LEVEL")
 
 
 class AppSettings(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     postgres: PostgresSettings
     sqla: SqlaEngineSettings
     security: SecuritySettings
@@ -146,7 +217,12 @@ def validate_env(*, env: str | None) -> ValidEnvs:
         ) from e
 
 
+@cache
 def get_current_env() -> ValidEnvs:
+    """
+    The environment is fixed for the lifetime of a process,
+    so it is read and validated only once.
+    """
     env_value = os.getenv(ENV_VAR_NAME)
     return validate_env(env=env_value)
 
@@ -167,37 +243,354 @@ def read_config(
         raise FileNotFoundError(
             f"The file does not exist at the specified path: {file_path}",
         )
-    with open(file=file_path, mode="r", encoding="utf-8") as file:
-        return rtoml.load(file)
+    file_stat = file_path.stat()
+    source_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    cache_path = dir_path / f"{config}{CONFIG_CACHE_SUFFIX}"
+    cached = _load_keyed_pickle(path=cache_path, key=source_key)
+    if cached is not None:
+        return cast(dict[str, Any], cached)
+    import rtoml  # noqa: PLC0415  # only needed when the cache is cold
+
+    raw = _read_file_bytes(file_path, size_hint=file_stat.st_size)
+    parsed = rtoml.loads(raw.decode("utf-8"))
+    _dump_keyed_pickle(path=cache_path, key=source_key, data=parsed)
+    return parsed
+
+
+def _read_file_bytes(file_path: Path, *, size_hint: int) -> bytes:
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, max(size_hint, 1)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _load_keyed_pickle(*, path: Path, key: object) -> Any | None:
+    """
+    Pickles written by this module sit next to the sources they were built from,
+    so they are trusted to the same degree as the TOML files themselves.
+    The key is stored as its own frame and compared before the data is unpickled,
+    so an outdated pickle never has to resolve the classes it refers to.
+    Any missing, unreadable or outdated pickle is ignored.
+    """
+    try:
+        with open(file=path, mode="rb") as file:
+            if pickle.load(file) != key:  # noqa: S301
+                return None
+            return pickle.load(file)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Unpickling can raise nearly anything, e.g. AttributeError on a renamed class.
+        log.debug("Pickle is unreadable, ignoring: '%s'", path)
+        return None
+
+
+def _read_pickle_key(path: Path) -> object | None:
+    try:
+        with open(file=path, mode="rb") as file:
+            stored_key: object = pickle.load(file)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.debug("Pickle is unreadable, ignoring: '%s'", path)
+        return None
+    return stored_key
+
+
+def _dump_keyed_pickle(*, path: Path, key: object, data: Any) -> None:
+    payload = b"".join(
+        pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL) for frame in (key, data)
+    )
+    try:
+        _write_private_file(path, payload)
+    except OSError:
+        log.debug("Pickle could not be written: '%s'", path)
+
+
+def _write_private_file(path: Path, payload: bytes) -> None:
+    """
+    Writes atomically, with permissions restricted to the owner,
+    since generated artifacts may contain secrets.
+
+    :raises OSError:
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, mode="wb") as file:
+            file.write(payload)
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def merge_dicts(*, dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merges iteratively using an explicit stack.
+    Only dicts present on both sides are copied, so inputs are never mutated.
+    Parsed config only ever contains plain dicts, hence the exact type checks.
+    """
     result = dict1.copy()
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(dict1=result[key], dict2=value)
-        else:
-            result[key] = value
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(result, dict2)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if type(current) is dict and type(value) is dict:
+                dst[key] = merged = current.copy()
+                stack.append((merged, value))
+            else:
+                dst[key] = value
     return result
 
 
-def load_full_config(*, env: ValidEnvs) -> dict[str, Any]:
-    log.info("Reading config for environment: '%s'", env)
+def merge_config_sources(*, env: ValidEnvs) -> dict[str, Any]:
     config = read_config(env=env)
     try:
         secrets = read_config(env=env, config=DirContents.SECRETS_NAME)
     except FileNotFoundError:
-        log.warning("Secrets file not found. Full config will not contain secrets.")
-    else:
-        config = merge_dicts(dict1=config, dict2=secrets)
+        last_good = read_last_good_secrets(env=env)
+        if last_good is None:
+            log.warning("Secrets file not found. Full config will not contain secrets.")
+            return config
+        log.warning("Secrets file not found. Using last known good secrets.")
+        return merge_dicts(dict1=config, dict2=last_good)
+    dump_last_good_secrets(env=env, secrets=secrets)
+    return merge_dicts(dict1=config, dict2=secrets)
+
+
+def dump_last_good_secrets(*, env: ValidEnvs, secrets: dict[str, Any]) -> None:
+    """
+    Keeps the last successfully read secrets around, so that a secrets file
+    that is briefly missing (e.g. being remounted during a rolling deploy)
+    does not produce an incomplete config on startup.
+    Keyed like the parse cache, so unchanged secrets are not rewritten.
+    """
+    dir_path = ENV_TO_DIR_PATHS.get(env)
+    if dir_path is None:
+        return
+    try:
+        file_stat = (dir_path / DirContents.SECRETS_NAME).stat()
+    except OSError:
+        return
+    source_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    last_good_path = dir_path / DirContents.LAST_GOOD_SECRETS_NAME
+    if _read_pickle_key(last_good_path) == source_key:
+        return
+    _dump_keyed_pickle(path=last_good_path, key=source_key, data=secrets)
+
+
+def read_last_good_secrets(*, env: ValidEnvs) -> dict[str, Any] | None:
+    """
+    The secrets file is gone at this point, so the stored key cannot be
+    checked against it; whatever was last stored is used.
+    """
+    dir_path = ENV_TO_DIR_PATHS.get(env)
+    if dir_path is None:
+        return None
+    last_good_path = dir_path / DirContents.LAST_GOOD_SECRETS_NAME
+    stored_key = _read_pickle_key(last_good_path)
+    if stored_key is None:
+        return None
+    secrets = _load_keyed_pickle(path=last_good_path, key=stored_key)
+    return cast(dict[str, Any] | None, secrets)
+
+
+def load_full_config(
+    *,
+    env: ValidEnvs,
+    config_fingerprint: str | None = None,
+) -> dict[str, Any]:
+    log.info("Reading config for environment: '%s'", env)
+    prebuilt = read_prebuilt_config(env=env, config_fingerprint=config_fingerprint)
+    if prebuilt is not None:
+        return prebuilt
+    return merge_config_sources(env=env)
+
+
+# PREBUILT CONFIG
+
+
+def get_config_fingerprint(*, env: ValidEnvs) -> str:
+    """
+    Identifies the contents of the config and secrets files.
+    """
+    dir_path = ENV_TO_DIR_PATHS.get(env)
+    if dir_path is None:
+        raise FileNotFoundError(f"No directory path configured for environment: {env}")
+    digest = hashlib.sha256()
+    for source in (DirContents.CONFIG_NAME, DirContents.SECRETS_NAME):
+        file_path = dir_path / source
+        digest.update(source.encode())
+        if file_path.is_file():
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def dump_prebuilt_config(env: ValidEnvs | None = None) -> Path:
+    """
+    Build step for the deploy pipeline: merges the TOML sources once
+    and stores the result as JSON, so runtime skips TOML parsing and merging.
+    Only JSON-representable values survive, which is all this config uses.
+    """
+    import orjson  # noqa: PLC0415
+
+    if env is None:
+        env = get_current_env()
+    prebuilt_path = ENV_TO_DIR_PATHS[env] / DirContents.PREBUILT_CONFIG_NAME
+    prebuilt = {
+        "fingerprint": get_config_fingerprint(env=env),
+        "config": merge_config_sources(env=env),
+    }
+    _write_private_file(prebuilt_path, orjson.dumps(prebuilt))
+    return prebuilt_path
+
+
+def read_prebuilt_config(
+    *,
+    env: ValidEnvs,
+    config_fingerprint: str | None = None,
+) -> dict[str, Any] | None:
+    import orjson  # noqa: PLC0415
+
+    dir_path = ENV_TO_DIR_PATHS.get(env)
+    if dir_path is None:
+        return None
+    prebuilt_path = dir_path / DirContents.PREBUILT_CONFIG_NAME
+    if not prebuilt_path.is_file():
+        return None
+    try:
+        prebuilt = orjson.loads(prebuilt_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        log.warning("Prebuilt config is unreadable, ignoring: '%s'", prebuilt_path)
+        return None
+    if config_fingerprint is None:
+        config_fingerprint = get_config_fingerprint(env=env)
+    fingerprint = prebuilt.get("fingerprint") if isinstance(prebuilt, dict) else None
+    if fingerprint != config_fingerprint:
+        log.info("Prebuilt config is outdated, falling back to TOML sources.")
+        return None
+    config = prebuilt.get("config")
+    if not isinstance(config, dict):
+        log.warning("Prebuilt config is malformed, ignoring: '%s'", prebuilt_path)
+        return None
     return config
 
 
+# SETTINGS SNAPSHOT
+
+
+@cache
+def get_settings_schema_fingerprint() -> str:
+    """
+    Identifies the settings schema by the source of the modules defining it,
+    so that changed fields or validators invalidate existing snapshots.
+    Cheaper than `model_json_schema()`, which would build the deferred schemas.
+    """
+    digest = hashlib.sha256()
+    for module_path in (Path(__file__), Path(inspect.getfile(LoggingLevel))):
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_settings_fingerprint(*, config_fingerprint: str) -> str:
+    """
+    Identifies everything a validated `AppSettings` is derived from:
+    the settings schema, the contents of the config and secrets files,
+    plus environment overrides.
+    """
+    digest = hashlib.sha256(get_settings_schema_fingerprint().encode())
+    digest.update(config_fingerprint.encode())
+    digest.update(os.environ.get("POSTGRES_HOST", "").encode())
+    return digest.hexdigest()
+
+
+def construct_model[M: BaseModel](model: type[M], values: dict[str, Any]) -> M:
+    """
+    Builds a model tree from trusted, already validated values
+    without running validation, recursing into nested models.
+    """
+    fields: dict[str, Any] = {}
+    for name, field_info in model.model_fields.items():
+        value = values[name]
+        annotation = field_info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = construct_model(annotation, value)
+        fields[name] = value
+    return model.model_construct(**fields)
+
+
+def dump_settings_snapshot(env: ValidEnvs | None = None) -> Path:
+    """
+    Pre-flight step for CI/dev: validates settings strictly and stores the result,
+    so that `load_settings` can skip validation until the sources change.
+    """
+    if env is None:
+        env = get_current_env()
+    settings = load_settings_strict(env)
+    snapshot_path = ENV_TO_DIR_PATHS[env] / DirContents.SETTINGS_SNAPSHOT_NAME
+    _dump_keyed_pickle(
+        path=snapshot_path,
+        key=get_settings_fingerprint(
+            config_fingerprint=get_config_fingerprint(env=env),
+        ),
+        data=settings.model_dump(),
+    )
+    return snapshot_path
+
+
+def read_settings_snapshot(
+    *,
+    env: ValidEnvs,
+    config_fingerprint: str,
+) -> dict[str, Any] | None:
+    dir_path = ENV_TO_DIR_PATHS.get(env)
+    if dir_path is None:
+        return None
+    snapshot_path = dir_path / DirContents.SETTINGS_SNAPSHOT_NAME
+    if not snapshot_path.is_file():
+        return None
+    snapshot = _load_keyed_pickle(
+        path=snapshot_path,
+        key=get_settings_fingerprint(config_fingerprint=config_fingerprint),
+    )
+    if snapshot is None:
+        log.info("Settings snapshot is outdated, falling back to strict validation.")
+        return None
+    return cast(dict[str, Any], snapshot)
+
+
 # PUBLIC INTERFACE
 
 
-def load_settings(env: ValidEnvs | None = None) -> AppSettings:
+def load_settings_strict(
+    env: ValidEnvs | None = None,
+    *,
+    config_fingerprint: str | None = None,
+) -> AppSettings:
     if env is None:
         env = get_current_env()
-    raw_config = load_full_config(env=env)
+    raw_config = load_full_config(env=env, config_fingerprint=config_fingerprint)
+    AppSettings.model_rebuild()
     return AppSettings.model_validate(raw_config)
+
+
+def load_settings(env: ValidEnvs | None = None) -> AppSettings:
+    if env is None:
+        env = get_current_env()
+    # Shared by the snapshot and prebuilt config checks, so sources are read once.
+    config_fingerprint = get_config_fingerprint(env=env)
+    snapshot = read_settings_snapshot(env=env, config_fingerprint=config_fingerprint)
+    if snapshot is not None:
+        try:
+            return construct_model(AppSettings, snapshot)
+        except (KeyError, TypeError):
+            log.info(
+                "Settings snapshot is outdated, falling back to strict validation."
+            )
+    return load_settings_strict(env, config_fingerprint=config_fingerprint)
@@ -1,4 +1,15 @@
-from line_profiler import LineProfiler
+import argparse
+import functools
+import itertools
+import shutil
+import subprocess  # noqa: S404
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import bcrypt
 
 from app.domain.value_objects.raw_password.raw_password import RawPassword
 from app.infrastructure.adapters.password_hasher_bcrypt import (
@@ -6,6 +17,30 @@ from app.infrastructure.adapters.password_hasher_bcrypt import (
     PasswordPepper,
 )
 
+if TYPE_CHECKING:
+    from line_profiler import LineProfiler
+
+MODES = ("batch", "parallel")
+DEFAULT_ITERATIONS = 10
+DEFAULT_ROUNDS = 12
+DEFAULT_OUTPUT = "flame.svg"
+
+
+def make_hasher() -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(PasswordPepper("Cayenne!"))
+
+
+def bcrypt_rounds(rounds: int) -> AbstractContextManager[Any]:
+    """
+    `BcryptPasswordHasher` relies on the default bcrypt cost factor.
+    Patching `gensalt` lets the profile be taken at other cost factors.
+    """
+    return patch.object(
+        bcrypt,
+        "gensalt",
+        functools.partial(bcrypt.gensalt, rounds=rounds),
+    )
+
 
 def run_operations(hasher: BcryptPasswordHasher) -> None:
     raw_password = RawPassword("raw_password")
@@ -13,22 +48,163 @@ def run_operations(hasher: BcryptPasswordHasher) -> None:
     hasher.verify(raw_password=raw_password, hashed_password=hashed)
 
 
-def setup_profiler() -> tuple[LineProfiler, BcryptPasswordHasher]:
-    hasher = BcryptPasswordHasher(PasswordPepper("Cayenne!"))
+def run_operations_batch(hasher: BcryptPasswordHasher, n: int) -> None:
+    """
+    Builds the value object once and hashes in a tight loop,
+    so the remaining Python overhead is the hasher's own per-call work.
+    """
+    raw_password = RawPassword("raw_password")
+    for _ in range(n):
+        hashed = hasher.hash(raw_password)
+        hasher.verify(raw_password=raw_password, hashed_password=hashed)
+
+
+def run_operations_parallel(
+    hasher: BcryptPasswordHasher,
+    n: int,
+    *,
+    rounds: int = DEFAULT_ROUNDS,
+    workers: int | None = None,
+) -> None:
+    """
+    bcrypt is CPU-bound, so processes rather than threads
+    make throughput scale with the number of cores.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(rounds,),
+    ) as executor:
+        for _ in executor.map(run_operations, itertools.repeat(hasher, n)):
+            pass
+
+
+def init_worker(rounds: int) -> None:
+    # Never undone: the patch lives exactly as long as the worker process.
+    patch.object(
+        bcrypt,
+        "gensalt",
+        functools.partial(bcrypt.gensalt, rounds=rounds),
+    ).start()
+
+
+def setup_profiler() -> tuple["LineProfiler", BcryptPasswordHasher]:
+    from line_profiler import LineProfiler  # noqa: PLC0415
+
+    hasher = make_hasher()
     profiler = LineProfiler()
 
     profiler.add_function(hasher.hash)
     profiler.add_function(hasher.verify)
     profiler.add_function(run_operations)
+    profiler.add_function(run_operations_batch)
 
     return profiler, hasher
 
 
-def main() -> None:
+def run_line_profiler(*, iterations: int) -> None:
+    """
+    Deterministic, per-line timings of the Python side.
+    Instrumentation overhead inflates the numbers.
+    """
     profiler, hasher = setup_profiler()
-    profiler.runcall(run_operations, hasher)  # type: ignore[no-untyped-call]
+    profiler.runcall(run_operations_batch, hasher, iterations)  # type: ignore[no-untyped-call]
     profiler.print_stats()
 
 
+def run_workload(
+    *,
+    mode: str,
+    iterations: int,
+    rounds: int,
+    workers: int | None,
+) -> None:
+    hasher = make_hasher()
+    with bcrypt_rounds(rounds):
+        if mode == "parallel":
+            run_operations_parallel(hasher, iterations, rounds=rounds, workers=workers)
+        else:
+            run_operations_batch(hasher, iterations)
+
+
+def run_py_spy(
+    *,
+    mode: str,
+    iterations: int,
+    rounds: int,
+    workers: int | None,
+    output: str,
+) -> None:
+    """
+    Statistical sampling with low overhead, including native frames,
+    so time spent inside bcrypt's C code is attributed as well.
+    """
+    py_spy = shutil.which("py-spy")
+    if py_spy is None:
+        raise SystemExit("py-spy is not installed. Run with --line-profiler instead.")
+    command = [py_spy, "record", "--native", "--output", output]
+    if mode == "parallel":
+        command.append("--subprocesses")
+    command += [
+        "--",
+        sys.executable,
+        __file__,
+        "--worker",
+        "--mode",
+        mode,
+        "--iterations",
+        str(iterations),
+        "--rounds",
+        str(rounds),
+    ]
+    if workers is not None:
+        command += ["--workers", str(workers)]
+    subprocess.run(command, check=True)  # noqa: S603
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Profile BcryptPasswordHasher.")
+    parser.add_argument("--mode", choices=MODES, default="batch")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help="bcrypt cost factor (log2 of key expansion rounds).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process pool size for --mode parallel (defaults to CPU count).",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--line-profiler", action="store_true")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.worker:
+        run_workload(
+            mode=args.mode,
+            iterations=args.iterations,
+            rounds=args.rounds,
+            workers=args.workers,
+        )
+    elif args.line_profiler:
+        with bcrypt_rounds(args.rounds):
+            run_line_profiler(iterations=args.iterations)
+    else:
+        run_py_spy(
+            mode=args.mode,
+            iterations=args.iterations,
+            rounds=args.rounds,
+            workers=args.workers,
+            output=args.output,
+        )
+
+
 if __name__ == "__main__":
     main()
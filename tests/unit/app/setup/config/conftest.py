@@ -1,7 +1,32 @@
 import copy
+from unittest.mock import patch
 
 import pytest
 
+from app.setup.config.constants import ValidEnvs
+from app.setup.config.settings import get_current_env
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dirs(tmp_path_factory):
+    """
+    Keeps tests independent of artifacts (caches, snapshots)
+    that may exist in the real config directories.
+    """
+    empty_dir = tmp_path_factory.mktemp("config")
+    with patch(
+        "app.setup.config.settings.ENV_TO_DIR_PATHS",
+        dict.fromkeys(ValidEnvs, empty_dir),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_current_env_cache():
+    get_current_env.cache_clear()
+    yield
+    get_current_env.cache_clear()
+
 
 @pytest.fixture
 def password_settings_config_dict_valid():
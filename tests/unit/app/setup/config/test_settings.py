@@ -5,17 +5,24 @@ from enum import StrEnum
 from pathlib import Path
 from unittest.mock import patch
 
+import orjson
 import pytest
 from pydantic import PostgresDsn, ValidationError
 
+from app.setup.config import logs
 from app.setup.config.constants import ValidEnvs
 from app.setup.config.settings import (
     AppSettings,
     AuthSettings,
     PostgresSettings,
+    construct_model,
+    dump_prebuilt_config,
+    dump_settings_snapshot,
+    get_config_fingerprint,
     get_current_env,
     load_full_config,
     load_settings,
+    load_settings_strict,
     merge_dicts,
     read_config,
     validate_env,
@@ -57,6 +64,26 @@ def test_auth_settings(session_ttl_min, session_refresh_threshold, expected_exce
             AuthSettings.model_validate(data)
 
 
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        pytest.param("SESSION_TTL_MIN", 0, id="ttl_min"),
+        pytest.param("SESSION_REFRESH_THRESHOLD", 1.5, id="session_refresh_threshold"),
+    ],
+)
+def test_auth_settings_error_location(auth_settings_config_dict_valid, field, value):
+    data = {**auth_settings_config_dict_valid, field: value}
+
+    with pytest.raises(ValidationError) as exc_info:
+        AuthSettings.model_validate(data)
+
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["loc"] == (field,)
+    assert errors[0]["input"] == value
+    assert data["JWT_SECRET"] not in str(exc_info.value)
+
+
 def test_postgres_settings_init_correct():
     with patch.dict(os.environ, {}, clear=False):
         os.environ.pop("POSTGRES_HOST", None)
@@ -95,6 +122,34 @@ def test_postgres_settings_init_correct():
         )
 
 
+def test_postgres_settings_dsn_cached(postgres_settings_config_dict_valid):
+    postgres_settings = PostgresSettings.model_validate(
+        postgres_settings_config_dict_valid,
+    )
+
+    with patch("app.setup.config.settings.PostgresDsn.build") as mock:
+        mock.return_value = "dsn"
+
+        assert postgres_settings.dsn == "dsn"
+        assert postgres_settings.dsn == "dsn"
+
+        mock.assert_called_once()
+
+
+def test_postgres_settings_dsn_after_copy(postgres_settings_config_dict_valid):
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("POSTGRES_HOST", None)
+        postgres_settings = PostgresSettings.model_validate(
+            postgres_settings_config_dict_valid,
+        )
+        assert "@test_host:" in postgres_settings.dsn
+
+        copied = postgres_settings.model_copy(update={"host": "other_host"})
+
+        assert "@other_host:" in copied.dsn
+        assert "@test_host:" in postgres_settings.dsn
+
+
 def test_postgres_settings_override_host_from_env():
     env_host = "env_host"
     input_host = "input_host"
@@ -176,6 +231,36 @@ def test_read_config(tmp_path):
             read_config(env=ValidEnvs.PROD)
 
 
+def test_read_config_uses_cache(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        first = read_config(env=ValidEnvs.DEV)
+
+        assert (tmp_path / "config.toml.cache.pkl").is_file()
+
+        with patch("rtoml.loads") as mock:
+            second = read_config(env=ValidEnvs.DEV)
+
+            mock.assert_not_called()
+
+        assert second == first
+
+
+def test_read_config_invalidates_cache(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        read_config(env=ValidEnvs.DEV)
+        config_file.write_text('[database]\nUSER = "test_postgres_changed"\n')
+
+        result = read_config(env=ValidEnvs.DEV)
+
+        assert result == {"database": {"USER": "test_postgres_changed"}}
+
+
 @pytest.mark.parametrize(
     ("dict1", "dict2", "result"),
     [
@@ -207,6 +292,17 @@ def test_merge_dicts_keep_original():
     assert original_dict2 == {"b": 2}
 
 
+def test_merge_dicts_keep_original_nested():
+    original_dict1 = {"a": {"x": {"y": 1}}}
+    original_dict2 = {"a": {"x": {"z": 2}}}
+
+    result = merge_dicts(dict1=original_dict1, dict2=original_dict2)
+
+    assert result == {"a": {"x": {"y": 1, "z": 2}}}
+    assert original_dict1 == {"a": {"x": {"y": 1}}}
+    assert original_dict2 == {"a": {"x": {"z": 2}}}
+
+
 def test_load_full_config(tmp_path):
     config_file = tmp_path / "config.toml"
     config_file.write_text('[database]\nUSER = "test_postgres"\nPORT = 1234\n')
@@ -224,6 +320,7 @@ def test_load_full_config(tmp_path):
         }
 
         secrets_file.unlink()
+        (tmp_path / ".secrets.last_good.pkl").unlink()
 
         result_no_secrets = load_full_config(env=ValidEnvs.DEV)
 
@@ -232,6 +329,127 @@ def test_load_full_config(tmp_path):
         }
 
 
+def test_load_full_config_last_good_secrets(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+    secrets_file = tmp_path / ".secrets.toml"
+    secrets_file.write_text('[database]\nPASSWORD = "secret"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        result = load_full_config(env=ValidEnvs.DEV)
+        secrets_file.unlink()
+
+        result_secrets_missing = load_full_config(env=ValidEnvs.DEV)
+
+        assert result_secrets_missing == result
+        assert result == {"database": {"USER": "test_postgres", "PASSWORD": "secret"}}
+
+
+def test_load_full_config_last_good_secrets_not_rewritten(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+    secrets_file = tmp_path / ".secrets.toml"
+    secrets_file.write_text('[database]\nPASSWORD = "secret"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        load_full_config(env=ValidEnvs.DEV)
+
+        with patch("app.setup.config.settings._dump_keyed_pickle") as mock:
+            load_full_config(env=ValidEnvs.DEV)
+
+            mock.assert_not_called()
+
+        secrets_file.write_text('[database]\nPASSWORD = "changed"\n')
+        load_full_config(env=ValidEnvs.DEV)
+        secrets_file.unlink()
+
+        result = load_full_config(env=ValidEnvs.DEV)
+
+        assert result["database"]["PASSWORD"] == "changed"
+
+
+def test_load_full_config_prebuilt(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+    (tmp_path / ".secrets.toml").write_text('[database]\nPASSWORD = "secret"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        dump_prebuilt_config(ValidEnvs.DEV)
+
+        with patch("app.setup.config.settings.read_config") as mock:
+            result = load_full_config(env=ValidEnvs.DEV)
+
+            mock.assert_not_called()
+
+        assert result == {"database": {"USER": "test_postgres", "PASSWORD": "secret"}}
+
+
+def test_dump_prebuilt_config_private(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        prebuilt_path = dump_prebuilt_config(ValidEnvs.DEV)
+
+    assert prebuilt_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_load_settings_fingerprints_sources_once(
+    tmp_path,
+    app_settings_config_dict_valid,
+):
+    (tmp_path / "config.toml").write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.merge_config_sources") as mock_merge,
+    ):
+        mock_merge.return_value = app_settings_config_dict_valid
+        dump_prebuilt_config(ValidEnvs.DEV)
+
+        with patch(
+            "app.setup.config.settings.get_config_fingerprint",
+            wraps=get_config_fingerprint,
+        ) as mock_fingerprint:
+            load_settings(ValidEnvs.DEV)
+
+            mock_fingerprint.assert_called_once()
+
+
+def test_load_full_config_prebuilt_outdated(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        dump_prebuilt_config(ValidEnvs.DEV)
+        config_file.write_text('[database]\nUSER = "test_postgres_changed"\n')
+
+        result = load_full_config(env=ValidEnvs.DEV)
+
+        assert result == {"database": {"USER": "test_postgres_changed"}}
+
+
+def test_load_full_config_prebuilt_malformed(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        prebuilt_path = dump_prebuilt_config(ValidEnvs.DEV)
+        fingerprint = get_config_fingerprint(env=ValidEnvs.DEV)
+        prebuilt_path.write_bytes(orjson.dumps({"fingerprint": fingerprint}))
+
+        result = load_full_config(env=ValidEnvs.DEV)
+
+        assert result == {"database": {"USER": "test_postgres"}}
+
+
+def test_load_full_config_prebuilt_unreadable(tmp_path):
+    (tmp_path / "config.toml").write_text('[database]\nUSER = "test_postgres"\n')
+
+    with patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}):
+        dump_prebuilt_config(ValidEnvs.DEV)
+
+        with patch.object(Path, "read_bytes", side_effect=PermissionError):
+            result = load_full_config(env=ValidEnvs.DEV)
+
+        assert result == {"database": {"USER": "test_postgres"}}
+
+
 def test_load_settings_with_env_correct(app_settings_config_dict_valid):
     valid_env = ValidEnvs.LOCAL
 
@@ -299,6 +517,14 @@ def test_get_current_env():
         assert get_current_env() == test_app_env_value
 
 
+def test_get_current_env_cached():
+    with patch.dict(os.environ, {"APP_ENV": ValidEnvs.DEV}):
+        assert get_current_env() == ValidEnvs.DEV
+
+    with patch.dict(os.environ, {"APP_ENV": ValidEnvs.PROD}):
+        assert get_current_env() == ValidEnvs.DEV
+
+
 def test_load_settings_invalid_config_dict_structure(app_settings_config_dict_invalid):
     valid_env = ValidEnvs.LOCAL
 
@@ -307,3 +533,133 @@ def test_load_settings_invalid_config_dict_structure(app_settings_config_dict_in
 
         with pytest.raises(ValidationError):
             load_settings(valid_env)
+
+
+def test_construct_model_nested(app_settings_config_dict_valid):
+    validated = AppSettings.model_validate(app_settings_config_dict_valid)
+
+    constructed = construct_model(AppSettings, validated.model_dump())
+
+    assert isinstance(constructed.security.auth, AuthSettings)
+    assert constructed == validated
+
+
+def test_load_settings_from_snapshot(tmp_path, app_settings_config_dict_valid):
+    (tmp_path / "config.toml").write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.load_full_config") as mock,
+    ):
+        mock.return_value = app_settings_config_dict_valid
+        expected = load_settings_strict(ValidEnvs.DEV)
+        dump_settings_snapshot(ValidEnvs.DEV)
+        mock.reset_mock()
+
+        settings = load_settings(ValidEnvs.DEV)
+
+        mock.assert_not_called()
+        assert settings == expected
+
+
+def test_load_settings_snapshot_outdated(tmp_path, app_settings_config_dict_valid):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.load_full_config") as mock,
+    ):
+        mock.return_value = app_settings_config_dict_valid
+        dump_settings_snapshot(ValidEnvs.DEV)
+        config_file.write_text('[logs]\nLEVEL = "INFO"\n')
+        mock.reset_mock()
+
+        load_settings(ValidEnvs.DEV)
+
+        mock.assert_called_once()
+
+
+def test_load_settings_snapshot_schema_changed(
+    tmp_path,
+    app_settings_config_dict_valid,
+):
+    (tmp_path / "config.toml").write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.load_full_config") as mock,
+    ):
+        mock.return_value = app_settings_config_dict_valid
+        dump_settings_snapshot(ValidEnvs.DEV)
+        mock.reset_mock()
+
+        with patch(
+            "app.setup.config.settings.get_settings_schema_fingerprint",
+            return_value="changed",
+        ):
+            load_settings(ValidEnvs.DEV)
+
+        mock.assert_called_once()
+
+
+@pytest.mark.parametrize("key_matches", [True, False])
+def test_load_settings_snapshot_unpicklable(
+    tmp_path,
+    app_settings_config_dict_valid,
+    key_matches,
+):
+    class OldLogLevel(StrEnum):
+        DEBUG = "DEBUG"
+
+    OldLogLevel.__module__ = logs.__name__
+    OldLogLevel.__qualname__ = OldLogLevel.__name__
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.load_full_config") as mock,
+    ):
+        mock.return_value = app_settings_config_dict_valid
+        # Written while the class existed, read after it was renamed.
+        with (
+            patch.object(logs, "OldLogLevel", OldLogLevel, create=True),
+            patch.object(
+                AppSettings,
+                "model_dump",
+                return_value={"logs": {"level": OldLogLevel.DEBUG}},
+            ),
+        ):
+            dump_settings_snapshot(ValidEnvs.DEV)
+        if not key_matches:
+            config_file.write_text('[logs]\nLEVEL = "INFO"\n')
+        mock.reset_mock()
+
+        load_settings(ValidEnvs.DEV)
+
+        mock.assert_called_once()
+
+
+def test_load_settings_snapshot_missing_field(
+    tmp_path,
+    app_settings_config_dict_valid,
+):
+    (tmp_path / "config.toml").write_text('[logs]\nLEVEL = "DEBUG"\n')
+
+    with (
+        patch("app.setup.config.settings.ENV_TO_DIR_PATHS", {ValidEnvs.DEV: tmp_path}),
+        patch("app.setup.config.settings.load_full_config") as mock,
+    ):
+        mock.return_value = app_settings_config_dict_valid
+        expected = load_settings_strict(ValidEnvs.DEV)
+        snapshot = expected.model_dump()
+        del snapshot["sqla"]["pool_size"]
+
+        with patch(
+            "app.setup.config.settings.read_settings_snapshot",
+            return_value=snapshot,
+        ):
+            settings = load_settings(ValidEnvs.DEV)
+
+        assert settings == expected